@@ -1,10 +1,196 @@
+import heapq
+import itertools
 import pickle
+import tempfile
+from operator import itemgetter
+
+
+class Descending:
+    """
+    Inverts the ordering of a value that can't be negated (e.g. a string)
+    for a DESC column in a mixed ASC/DESC ORDER BY.
+    """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+def sort_key(order_by):
+    """
+    Builds a native tuple key function for order_by, a list of (column, descending)
+    tuples, so sorting compares plain tuples instead of calling Python methods.
+    Returns (key, reverse): when every column is DESC the caller sorts with
+    reverse=True. NULLs (missing values) sort last in ascending order and first
+    in descending order.
+    """
+    reverse = all(desc for _, desc in order_by)
+    columns = [(col, desc and not reverse) for col, desc in order_by]
+
+    if len(columns) == 1 and not columns[0][1]:
+        col = columns[0][0]
+
+        def key(row):
+            v = row.get(col)
+            return (v is None, v)
+        return key, reverse
+
+    def key(row):
+        out = []
+        for col, desc in columns:
+            v = row.get(col)
+            if not desc:
+                out.append(v is None)
+                out.append(v)
+            elif v is None:
+                out.append(False)
+                out.append(None)
+            else:
+                out.append(True)
+                # Numbers are simply negated, anything else gets a wrapper
+                out.append(-v if isinstance(v, (int, float)) else Descending(v))
+        return tuple(out)
+    return key, reverse
+
+
+def top_n(records, order_by, limit):
+    """Returns the first `limit` records in order, holding at most `limit` in a heap."""
+    key, reverse = sort_key(order_by)
+    # nsmallest/nlargest are stable on ties, like sorted()
+    if reverse:
+        return heapq.nlargest(limit, records, key=key)
+    return heapq.nsmallest(limit, records, key=key)
+
+
+def external_sort(records, order_by, buffer_rows):
+    """
+    Generator yielding the rows of the `records` list in order.
+    Only (sort key, position) pairs are sorted, at most buffer_rows of
+    them in memory at once. Full buffers are written as sorted runs to a
+    temporary file and k-way merged back with heapq.merge, at most
+    MERGE_FAN_IN runs per merge, in as many passes as needed. The yielded
+    rows are the original dicts from `records`, never copies.
+    """
+    if len(order_by) == 1:
+        # Sort on the raw column value so list.sort can use its fast
+        # same-type comparisons; NULL rows are set aside in position order.
+        col, reverse = order_by[0]
+        key = None
+    else:
+        key, reverse = sort_key(order_by)
+
+    in_memory = len(records) <= buffer_rows
+    positions = []
+    spill = None        # temp file holding every sorted run
+    runs = []           # (start, end) offsets of each run in spill
+    null_spill = None
+    null_runs = []
+    nulls = []
+    try:
+        for start in range(0, len(records), buffer_rows):
+            chunk = records[start:start + buffer_rows]
+            if key is None:
+                keys = [r.get(col) for r in chunk]
+                if None in keys:
+                    nulls.extend(start + i for i, v in enumerate(keys) if v is None)
+                    positions = [i for i, v in enumerate(keys) if v is not None]
+                else:
+                    positions = range(len(keys))
+            else:
+                keys = [key(r) for r in chunk]
+                positions = range(len(keys))
+
+            # sorted() is stable, reverse=True included
+            positions = sorted(positions, key=keys.__getitem__, reverse=reverse)
+            if in_memory:
+                # Everything fits in one buffer, no disk I/O needed
+                break
+
+            if spill is None:
+                spill = tempfile.TemporaryFile()
+            runs.append(_write_run(spill, [(keys[i], start + i) for i in positions]))
+            if len(nulls) >= buffer_rows:
+                if null_spill is None:
+                    null_spill = tempfile.TemporaryFile()
+                null_runs.append(_write_run(null_spill, nulls))
+                nulls = []
+
+        if in_memory:
+            ordered = positions
+        else:
+            # heapq.merge takes equal keys from earlier runs first, so merging
+            # consecutive groups of runs keeps the sort stable
+            merge = lambda f, group: heapq.merge(*(_read_run(f, *run) for run in group),
+                                                 key=itemgetter(0), reverse=reverse)
+            while len(runs) > MERGE_FAN_IN:
+                previous, spill = spill, tempfile.TemporaryFile()
+                try:
+                    runs = [_write_run(spill, merge(previous, runs[i:i + MERGE_FAN_IN]))
+                            for i in range(0, len(runs), MERGE_FAN_IN)]
+                finally:
+                    previous.close()
+            ordered = (pos for _, pos in merge(spill, runs))
+
+        # NULLs sort last ascending and first descending
+        null_positions = itertools.chain(*(_read_run(null_spill, *run) for run in null_runs), nulls)
+        if reverse:
+            ordered = itertools.chain(null_positions, ordered)
+        else:
+            ordered = itertools.chain(ordered, null_positions)
+
+        yield from map(records.__getitem__, ordered)
+    finally:
+        for f in (spill, null_spill):
+            if f is not None:
+                f.close()
+
+
+# Most runs merged at once. Bounds both the blocks held in memory and the
+# read positions tracked during a merge pass.
+MERGE_FAN_IN = 64
+
+# Entries pickled per block in a spilled run. Pickling blocks instead of single
+# entries keeps the per-entry overhead low while reading a run stays streaming.
+SPILL_BLOCK_SIZE = 128
+
+
+def _write_run(f, sorted_entries):
+    """Appends one sorted run to f in blocks and returns its (start, end) offsets."""
+    f.seek(0, 2)
+    start = f.tell()
+    entries = iter(sorted_entries)
+    while block := list(itertools.islice(entries, SPILL_BLOCK_SIZE)):
+        pickle.dump(block, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return start, f.tell()
+
+
+def _read_run(f, start, end):
+    """
+    Streams the entries of the run at [start, end) back out of f one block
+    at a time. Seeks before every block, so several runs can be read from
+    the same file at once.
+    """
+    pos = start
+    while pos < end:
+        f.seek(pos)
+        block = pickle.load(f)
+        pos = f.tell()
+        yield from block
+
 
 class Engine:
     """The core DB engine that manages multiple tables."""
     
-    def __init__(self):
+    def __init__(self, sort_buffer_rows=100_000):
         self.tables = {}
+        # Max rows an ORDER BY keeps in memory before spilling a sorted run to disk
+        self.sort_buffer_rows = sort_buffer_rows
 
     def create_table(self, name, schema, primary_key=None, unique_keys=None):
         if name in self.tables:
@@ -177,9 +363,13 @@ class Table:
                         # Ensure type consistency
                         record[col] = self.schema[col](val)
                 
-                # IMPORTANT: If an indexed column was updated, 
-                # you would technically need to rebuild that index here.
                 count += 1
+
+        # Indexed columns that changed must be rebuilt so index lookups stay correct
+        if count:
+            for col in updates:
+                if col in self.indexes:
+                    self.create_index(col)
         return f"Updated {count} records."
 
     def delete_records(self, filter_func):
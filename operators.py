@@ -0,0 +1,340 @@
+from itertools import islice
+
+from engine import external_sort, top_n
+
+# Rows passed between operators per call. Large enough to amortize the
+# per-batch generator overhead, small enough to keep batches cache friendly.
+DEFAULT_BATCH_SIZE = 1024
+
+
+class Operator:
+    """
+    Base class for physical query operators.
+    Operators form a tree and pull row batches (lists of dicts) from their
+    children through batches(). Every operator exposes the schema of the
+    rows it produces as {'col_name': type}.
+    """
+
+    schema = {}
+
+    def batches(self):
+        raise NotImplementedError
+
+    def execute(self):
+        """Drains the pipeline and returns all rows as a single list."""
+        rows = []
+        for batch in self.batches():
+            rows.extend(batch)
+        return rows
+
+
+class Scan(Operator):
+    """Full table scan, yielding the table's rows in fixed-size slices."""
+
+    def __init__(self, table, batch_size=DEFAULT_BATCH_SIZE):
+        self.table = table
+        self.schema = table.schema
+        self.batch_size = batch_size
+
+    def batches(self):
+        data = self.table.data
+        for start in range(0, len(data), self.batch_size):
+            yield data[start:start + self.batch_size]
+
+
+class IndexLookup(Operator):
+    """Equality lookup through a table's hash index, O(1) instead of a scan."""
+
+    def __init__(self, table, column_name, value):
+        if column_name not in table.indexes:
+            raise ValueError(f"No index on '{column_name}'.")
+        self.table = table
+        self.schema = table.schema
+        self.column_name = column_name
+        self.value = value
+
+    def batches(self):
+        matches = self.table.indexes[self.column_name].get(self.value)
+        if matches:
+            yield matches
+
+
+class Filter(Operator):
+    """
+    Keeps rows where column == value.
+    The comparison is inlined in a list comprehension, so there is no
+    Python function call per row like with a filter lambda.
+    """
+
+    def __init__(self, child, column_name, value):
+        self.child = child
+        self.schema = child.schema
+        self.column_name = column_name
+        self.value = value
+
+    def batches(self):
+        col, val = self.column_name, self.value
+        for batch in self.child.batches():
+            out = [r for r in batch if r.get(col) == val]
+            if out:
+                yield out
+
+
+class Project(Operator):
+    """Narrows every row down to the given columns, in the given order."""
+
+    def __init__(self, child, columns):
+        for col in columns:
+            if col not in child.schema:
+                raise ValueError(f"Column '{col}' does not exist.")
+        self.child = child
+        self.columns = columns
+        self.schema = {col: child.schema[col] for col in columns}
+
+    def batches(self):
+        cols = self.columns
+        for batch in self.child.batches():
+            yield [{c: r.get(c) for c in cols} for r in batch]
+
+
+class HashJoin(Operator):
+    """
+    Inner equi-join. Builds a hash table on the right input (or reuses the
+    right table's index when it is a plain Scan) and probes it batch by batch
+    with the left input. Output columns are prefixed with the table names,
+    matching Engine.inner_join.
+    """
+
+    def __init__(self, left, right, left_on, right_on, left_name, right_name):
+        if left_on not in left.schema:
+            raise ValueError(f"Column '{left_on}' does not exist in '{left_name}'.")
+        if right_on not in right.schema:
+            raise ValueError(f"Column '{right_on}' does not exist in '{right_name}'.")
+        self.left = left
+        self.right = right
+        self.left_on = left_on
+        self.right_on = right_on
+        self.left_name = left_name
+        self.right_name = right_name
+
+        self.schema = {}
+        for k, t in left.schema.items():
+            self.schema[f"{left_name}_{k}"] = t
+        for k, t in right.schema.items():
+            self.schema[f"{right_name}_{k}"] = t
+
+    def _build(self):
+        if isinstance(self.right, Scan) and self.right_on in self.right.table.indexes:
+            return self.right.table.indexes[self.right_on]
+
+        hashed = {}
+        for batch in self.right.batches():
+            for r in batch:
+                hashed.setdefault(r.get(self.right_on), []).append(r)
+        return hashed
+
+    def batches(self):
+        hashed = self._build()
+        left_on = self.left_on
+        l_prefix = f"{self.left_name}_"
+        r_prefix = f"{self.right_name}_"
+
+        for batch in self.left.batches():
+            out = []
+            for l_row in batch:
+                matches = hashed.get(l_row.get(left_on))
+                if not matches:
+                    continue
+                left_part = {l_prefix + k: v for k, v in l_row.items()}
+                for m in matches:
+                    combined = dict(left_part)
+                    for k, v in m.items():
+                        combined[r_prefix + k] = v
+                    out.append(combined)
+            if out:
+                yield out
+
+
+class Aggregate(Operator):
+    """
+    Hash aggregation with optional GROUP BY.
+    aggregates: list of (func, column) tuples, func in COUNT/SUM/AVG/MIN/MAX,
+    column '*' only valid for COUNT. Output columns are named like 'SUM(score)'.
+    """
+
+    FUNCTIONS = ('COUNT', 'SUM', 'AVG', 'MIN', 'MAX')
+
+    def __init__(self, child, group_by, aggregates):
+        self.child = child
+        self.group_by = group_by
+        self.aggregates = aggregates
+
+        self.schema = {}
+        for col in group_by:
+            if col not in child.schema:
+                raise ValueError(f"Column '{col}' does not exist.")
+            self.schema[col] = child.schema[col]
+        for func, col in aggregates:
+            if func not in self.FUNCTIONS:
+                raise ValueError(f"Unknown aggregate function '{func}'.")
+            if col == '*' and func != 'COUNT':
+                raise ValueError(f"{func}(*) is not supported.")
+            if col != '*' and col not in child.schema:
+                raise ValueError(f"Column '{col}' does not exist.")
+            if func in ('SUM', 'AVG') and child.schema[col] not in (int, float):
+                raise ValueError(f"{func}({col}) requires a numeric column.")
+            if func == 'COUNT':
+                out_type = int
+            elif func == 'AVG':
+                out_type = float
+            else:
+                out_type = child.schema[col]
+            self.schema[self.output_name(func, col)] = out_type
+
+    @staticmethod
+    def output_name(func, col):
+        return f"{func}({col})"
+
+    def batches(self):
+        group_by = self.group_by
+        single = len(group_by) == 1
+        # groups: {group_key: [[non-null count, accumulator] per aggregate]}
+        groups = {}
+        for batch in self.child.batches():
+            # Bucket the batch by group, then reduce each bucket column-wise
+            if not group_by:
+                buckets = {(): batch}
+            else:
+                buckets = {}
+                if single:
+                    col = group_by[0]
+                    for r in batch:
+                        key = r.get(col)
+                        bucket = buckets.get(key)
+                        if bucket is None:
+                            buckets[key] = [r]
+                        else:
+                            bucket.append(r)
+                else:
+                    for r in batch:
+                        buckets.setdefault(tuple(r.get(c) for c in group_by), []).append(r)
+
+            for key, rows in buckets.items():
+                state = groups.get(key)
+                if state is None:
+                    state = groups[key] = [[0, None] for _ in self.aggregates]
+                for (func, col), st in zip(self.aggregates, state):
+                    self._accumulate(st, func, col, rows)
+
+        # A global aggregate over no rows still yields one row (e.g. COUNT(*) = 0)
+        if not groups and not group_by:
+            groups[()] = [[0, None] for _ in self.aggregates]
+
+        out = []
+        for key, state in groups.items():
+            row = dict(zip(group_by, (key,) if single else key))
+            for (func, col), (count, acc) in zip(self.aggregates, state):
+                if func == 'COUNT':
+                    value = count
+                elif func == 'AVG':
+                    value = acc / count if count else None
+                else:
+                    value = acc
+                row[self.output_name(func, col)] = value
+            out.append(row)
+        if out:
+            yield out
+
+    @staticmethod
+    def _accumulate(state, func, col, rows):
+        """Folds one bucket of rows into state; NULLs are skipped like in SQL."""
+        if col == '*':
+            state[0] += len(rows)
+            return
+        values = [v for r in rows if (v := r.get(col)) is not None]
+        if not values:
+            return
+        state[0] += len(values)
+        if func == 'COUNT':
+            return
+        acc = state[1]
+        if func in ('SUM', 'AVG'):
+            part = sum(values)
+            state[1] = part if acc is None else acc + part
+        elif func == 'MIN':
+            part = min(values)
+            state[1] = part if acc is None or part < acc else acc
+        elif func == 'MAX':
+            part = max(values)
+            state[1] = part if acc is None or part > acc else acc
+
+
+class Sort(Operator):
+    """
+    ORDER BY. order_by is a list of (column, descending) tuples.
+    A limit of at most buffer_rows is served from a bounded top-N heap.
+    Anything else runs the external merge sort, which spills past
+    buffer_rows rows, and stops after the limit.
+    """
+
+    def __init__(self, child, order_by, buffer_rows, limit=None, batch_size=DEFAULT_BATCH_SIZE):
+        for col, _ in order_by:
+            if col not in child.schema:
+                raise ValueError(f"Column '{col}' does not exist.")
+        self.child = child
+        self.schema = child.schema
+        self.order_by = order_by
+        self.buffer_rows = buffer_rows
+        self.limit = limit
+        self.batch_size = batch_size
+
+    def _rows(self):
+        for batch in self.child.batches():
+            yield from batch
+
+    def batches(self):
+        if self.limit is not None and self.limit <= self.buffer_rows:
+            rows = top_n(self._rows(), self.order_by, self.limit)
+            if rows:
+                yield rows
+            return
+
+        # external_sort needs random access to the rows. A plain Scan can hand
+        # over the table's own list; otherwise collect references (not copies).
+        if isinstance(self.child, Scan):
+            rows = self.child.table.data
+        else:
+            rows = list(self._rows())
+
+        ordered = external_sort(rows, self.order_by, self.buffer_rows)
+        if self.limit is not None:
+            ordered = islice(ordered, self.limit)
+
+        batch = []
+        for row in ordered:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+class Limit(Operator):
+    """Passes through the first n rows and stops pulling from its child."""
+
+    def __init__(self, child, n):
+        self.child = child
+        self.schema = child.schema
+        self.n = n
+
+    def batches(self):
+        remaining = self.n
+        if remaining <= 0:
+            return
+        for batch in self.child.batches():
+            if len(batch) >= remaining:
+                yield batch[:remaining]
+                return
+            remaining -= len(batch)
+            yield batch
@@ -1,10 +1,11 @@
 import re
+from operators import Aggregate, Filter, HashJoin, IndexLookup, Limit, Project, Scan, Sort
 
 class Tokenizer:
     """Converts a SQL string into a list of meaningful tokens."""
     
     TOKEN_SPECIFICATION = [
-        ('KEYWORD', r'\b(CREATE|TABLE|INSERT|INTO|VALUES|SELECT|FROM|WHERE|JOIN|ON|PRIMARY|KEY|UNIQUE|INT|STR|UPDATE|SET|DELETE|SAVE|LOAD)\b'),
+        ('KEYWORD', r'\b(CREATE|TABLE|INSERT|INTO|VALUES|SELECT|FROM|WHERE|JOIN|ON|PRIMARY|KEY|UNIQUE|INT|STR|UPDATE|SET|DELETE|SAVE|LOAD|ORDER|BY|ASC|DESC|LIMIT|GROUP)\b'),
         ('NUMBER',     r'\d+'),                     # Integer literals
         ('STRING',     r"'(?:[^'\\]|\\.)*'"),       # String literals inside single quotes
         ('ID',         r'[a-zA-Z_][a-zA-Z0-9_]*'),  # Identifiers (table/column names)
@@ -126,29 +127,155 @@ class Parser:
             raise ValueError(f"Insert failed: {str(e)}")
 
     def _handle_select(self, tokens):
-        # Search for the table name following the 'FROM' keyword
+        # Build a physical operator pipeline and drain it
         try:
-            # Find the index of the 'FROM' token
-            from_index = -1
-            for i, (kind, value) in enumerate(tokens):
-                if kind == 'KEYWORD' and value == 'FROM':
-                    from_index = i
-                    break
-            
-            if from_index == -1 or from_index + 1 >= len(tokens):
-                raise ValueError("Syntax Error: Expected table name after FROM")
-            
-            table_name = tokens[from_index + 1][1]
-            table = self.engine.get_table(table_name)
-            
-            # 2. Extract filter function
-            filter_func = self._extract_where_clause(tokens)
-
-            # 3. Use Engine's read_records with the filter
-            return table.read_records(filter_func)
+            return self._build_select_plan(tokens).execute()
         except IndexError:
             raise ValueError("Syntax Error: SELECT statement is incomplete.")
-        
+
+    def _build_select_plan(self, tokens):
+        """
+        Syntax: SELECT <cols|*|FUNC(col)> FROM <table> [JOIN <table> ON <col> = <col>]
+                [WHERE <col> = <val>] [GROUP BY <cols>] [ORDER BY <cols>] [LIMIT <n>]
+        Pipeline: Scan/IndexLookup -> HashJoin -> Filter -> Aggregate -> Sort -> Limit -> Project
+        """
+        # 1. Find the index of the 'FROM' token
+        from_index = -1
+        for i, (kind, value) in enumerate(tokens):
+            if kind == 'KEYWORD' and value == 'FROM':
+                from_index = i
+                break
+
+        if from_index == -1 or from_index + 1 >= len(tokens):
+            raise ValueError("Syntax Error: Expected table name after FROM")
+
+        columns, aggregates, output = self._extract_select_list(tokens[:from_index])
+        table_name = tokens[from_index + 1][1]
+        table = self.engine.get_table(table_name)
+        condition = self._extract_where_condition(tokens)
+
+        # 2. Access path (+ optional join)
+        idx = from_index + 2
+        if idx < len(tokens) and tokens[idx][1] == 'JOIN':
+            right_name = tokens[idx + 1][1]
+            if tokens[idx + 2][1] != 'ON' or tokens[idx + 4][1] != '=':
+                raise ValueError("Expected 'JOIN <table> ON <col> = <col>'")
+            left_on, right_on = tokens[idx + 3][1], tokens[idx + 5][1]
+            right = Scan(self.engine.get_table(right_name))
+            plan = HashJoin(Scan(table), right, left_on, right_on, table_name, right_name)
+            if condition:
+                col, value = condition
+                plan = Filter(plan, col, self._coerce(plan.schema, col, value))
+        elif condition and condition[0] in table.indexes:
+            col, value = condition
+            plan = IndexLookup(table, col, self._coerce(table.schema, col, value))
+        else:
+            plan = Scan(table)
+            if condition:
+                col, value = condition
+                plan = Filter(plan, col, self._coerce(table.schema, col, value))
+
+        # 3. Aggregation
+        group_by = self._extract_group_by_clause(tokens)
+        if aggregates or group_by:
+            for col in columns:
+                if col not in group_by:
+                    raise ValueError(f"Column '{col}' must appear in GROUP BY.")
+            plan = Aggregate(plan, group_by, aggregates)
+
+        # 4. Ordering and limiting
+        order_by = self._extract_order_by_clause(tokens)
+        limit = self._extract_limit_clause(tokens)
+        if order_by:
+            plan = Sort(plan, order_by, self.engine.sort_buffer_rows, limit=limit)
+        if limit is not None:
+            plan = Limit(plan, limit)
+
+        # 5. Projection in SELECT list order (last, so ORDER BY can use columns that aren't selected)
+        if output:
+            plan = Project(plan, output)
+        return plan
+
+    def _extract_select_list(self, tokens):
+        """
+        Parses the items between SELECT and FROM.
+        Returns (columns, aggregates, output): the plain columns, the (func, column)
+        aggregates, and every output column name in SELECT list order.
+        All three are empty for '*'.
+        Example: name, COUNT(*), SUM(score)
+        """
+        if not tokens:
+            raise ValueError("Malformed SELECT list.")
+        columns = []
+        aggregates = []
+        output = []
+        idx = 0
+        while idx < len(tokens):
+            kind, value = tokens[idx]
+            if value == '*':
+                if len(tokens) > 1:
+                    raise ValueError("'*' cannot be combined with other SELECT items.")
+                idx += 1
+            elif kind == 'ID' and idx + 1 < len(tokens) and tokens[idx + 1][1] == '(':
+                # Aggregate function: FUNC ( col | * )
+                if tokens[idx + 3][1] != ')':
+                    raise ValueError(f"Expected ')' after {value}(")
+                func, col = value.upper(), tokens[idx + 2][1]
+                aggregates.append((func, col))
+                output.append(Aggregate.output_name(func, col))
+                idx += 4
+            elif kind == 'ID':
+                columns.append(value)
+                output.append(value)
+                idx += 1
+            else:
+                raise ValueError(f"Unexpected '{value}' in SELECT list.")
+
+            if idx < len(tokens):
+                if tokens[idx][1] != ',':
+                    raise ValueError("Expected ',' between SELECT columns.")
+                idx += 1
+                if idx == len(tokens):
+                    raise ValueError("Malformed SELECT list.")
+        return columns, aggregates, output
+
+    def _extract_group_by_clause(self, tokens):
+        """
+        Look for 'GROUP BY' in tokens and return the list of grouping columns.
+        Example: GROUP BY name, cat_id
+        """
+        for i, (kind, value) in enumerate(tokens):
+            if kind == 'KEYWORD' and value == 'GROUP':
+                if i + 1 >= len(tokens) or tokens[i + 1][1] != 'BY':
+                    raise ValueError("Expected 'BY' after 'GROUP'")
+                group_by = []
+                idx = i + 2
+                while True:
+                    if idx >= len(tokens) or tokens[idx][0] != 'ID':
+                        raise ValueError("Malformed GROUP BY clause.")
+                    group_by.append(tokens[idx][1])
+                    idx += 1
+                    if idx < len(tokens) and tokens[idx][1] == ',':
+                        idx += 1
+                        continue
+                    break
+
+                # Only ORDER BY or LIMIT may follow the GROUP BY list
+                if idx < len(tokens) and tokens[idx][1] not in ('ORDER', 'LIMIT'):
+                    raise ValueError(f"Unexpected '{tokens[idx][1]}' after GROUP BY clause.")
+                return group_by
+        return []
+
+    def _coerce(self, schema, col_name, value):
+        """Converts a WHERE literal to the column's type so operators can compare directly."""
+        if col_name not in schema:
+            raise ValueError(f"Column '{col_name}' does not exist.")
+        try:
+            return schema[col_name](value)
+        except ValueError:
+            # e.g. WHERE id = 'abc': keep the raw value, which never matches
+            return value
+
     def _handle_delete(self, tokens):
         # tokens[0] is 'FROM'
         table_name = tokens[1][1]
@@ -184,6 +311,17 @@ class Parser:
         Look for 'WHERE' in tokens and return a filter function.
         Example: WHERE id = 1
         """
+        condition = self._extract_where_condition(tokens)
+        if condition is None:
+            return None
+        col_name, target_value = condition
+        return lambda row: str(row.get(col_name)) == str(target_value)
+
+    def _extract_where_condition(self, tokens):
+        """
+        Look for 'WHERE' in tokens and return a (column, value) equality condition.
+        Example: WHERE id = 1 -> ('id', 1)
+        """
         try:
             where_index = -1
             for i, (kind, value) in enumerate(tokens):
@@ -199,15 +337,77 @@ class Parser:
             operator = tokens[where_index + 2][1]
             target_value = tokens[where_index + 3][1]
 
-            # Return a lambda that checks the condition
-            # Note: For a robust DB, you'd handle types and different operators here
+            # Note: For a robust DB, you'd handle different operators here
             if operator == "=":
-                return lambda row: str(row.get(col_name)) == str(target_value)
+                return (col_name, target_value)
             
             return None
         except (IndexError, ValueError):
             raise ValueError("Malformed WHERE clause.")
         
+    def _extract_order_by_clause(self, tokens):
+        """
+        Look for 'ORDER BY' in tokens and return a list of (column, descending) tuples.
+        Aggregates are referred to by their output name, e.g. COUNT(*) -> 'COUNT(*)'.
+        Example: ORDER BY name ASC, COUNT(*) DESC
+        """
+        order_index = -1
+        for i, (kind, value) in enumerate(tokens):
+            if kind == 'KEYWORD' and value == 'ORDER':
+                order_index = i
+                break
+
+        if order_index == -1:
+            return [] # No ORDER BY clause present
+
+        if order_index + 1 >= len(tokens) or tokens[order_index + 1][1] != 'BY':
+            raise ValueError("Expected 'BY' after 'ORDER'")
+
+        order_by = []
+        idx = order_index + 2
+        while True:
+            if idx >= len(tokens) or tokens[idx][0] != 'ID':
+                raise ValueError("Malformed ORDER BY clause.")
+            value = tokens[idx][1]
+            if idx + 1 < len(tokens) and tokens[idx + 1][1] == '(':
+                # Aggregate: FUNC ( col | * )
+                if idx + 3 >= len(tokens) or tokens[idx + 3][1] != ')':
+                    raise ValueError(f"Expected ')' after {value}(")
+                value = Aggregate.output_name(value.upper(), tokens[idx + 2][1])
+                idx += 4
+            else:
+                idx += 1
+            descending = False
+            if idx < len(tokens) and tokens[idx][1] in ('ASC', 'DESC'):
+                descending = tokens[idx][1] == 'DESC'
+                idx += 1
+            order_by.append((value, descending))
+
+            if idx < len(tokens) and tokens[idx][1] == ',':
+                idx += 1
+                continue
+            break
+
+        # Only a LIMIT may follow the ORDER BY list
+        if idx < len(tokens) and tokens[idx][1] != 'LIMIT':
+            raise ValueError(f"Unexpected '{tokens[idx][1]}' after ORDER BY clause.")
+        return order_by
+
+    def _extract_limit_clause(self, tokens):
+        """
+        Look for 'LIMIT' in tokens and return the row count, or None.
+        LIMIT <n> must be the last clause of the statement.
+        Example: LIMIT 10
+        """
+        for i, (kind, value) in enumerate(tokens):
+            if kind == 'KEYWORD' and value == 'LIMIT':
+                if i + 1 >= len(tokens) or tokens[i + 1][0] != 'NUMBER':
+                    raise ValueError("Expected a number after 'LIMIT'")
+                if i + 2 < len(tokens):
+                    raise ValueError(f"Unexpected '{tokens[i + 2][1]}' after LIMIT clause.")
+                return tokens[i + 1][1]
+        return None
+
     def _handle_save(self, tokens):
         # Syntax: SAVE 'filename.db'
         filename = tokens[0][1]
@@ -0,0 +1,88 @@
+from engine import Engine
+from parser import Parser
+from operators import Filter, IndexLookup, Scan
+
+db = Engine()
+parser = Parser(db)
+
+parser.execute("CREATE TABLE categories (id INT, name STR) PRIMARY KEY id")
+parser.execute("CREATE TABLE tasks (id INT, name STR, cat_id INT, hours INT) PRIMARY KEY id")
+parser.execute("INSERT INTO categories VALUES (1, 'Work')")
+parser.execute("INSERT INTO categories VALUES (2, 'Personal')")
+parser.execute("INSERT INTO tasks VALUES (1, 'Report', 1, 3)")
+parser.execute("INSERT INTO tasks VALUES (2, 'Email', 1, 1)")
+parser.execute("INSERT INTO tasks VALUES (3, 'Gym', 2, 2)")
+parser.execute("INSERT INTO tasks VALUES (4, 'Review', 1, 5)")
+
+
+def plan_for(sql):
+    # _handle_select receives the tokens after SELECT
+    return parser._build_select_plan(parser.tokenizer.tokenize(sql)[1:])
+
+
+# 1. Select list projects columns in the order given
+result = parser.execute("SELECT name, id FROM tasks WHERE cat_id = 2")
+assert result == [{"name": "Gym", "id": 3}]
+assert list(result[0]) == ["name", "id"]
+
+# 2. WHERE on an indexed column uses the hash index, otherwise scan + filter
+assert isinstance(plan_for("SELECT * FROM tasks WHERE id = 2"), IndexLookup)
+assert isinstance(plan_for("SELECT * FROM tasks WHERE cat_id = 1"), Filter)
+assert isinstance(plan_for("SELECT * FROM tasks"), Scan)
+assert parser.execute("SELECT * FROM tasks WHERE id = 2") == [{"id": 2, "name": "Email", "cat_id": 1, "hours": 1}]
+assert parser.execute("SELECT * FROM tasks WHERE id = '2'") == parser.execute("SELECT * FROM tasks WHERE id = 2")
+assert parser.execute("SELECT * FROM tasks WHERE id = 99") == []
+
+# 3. JOIN ... ON, matching Engine.inner_join, with WHERE on prefixed columns
+result = parser.execute("SELECT * FROM tasks JOIN categories ON cat_id = id")
+assert result == db.inner_join("tasks", "categories", "cat_id", "id")
+result = parser.execute("SELECT tasks_name FROM tasks JOIN categories ON cat_id = id WHERE categories_name = 'Personal'")
+assert result == [{"tasks_name": "Gym"}]
+assert parser.execute("SELECT * FROM tasks JOIN categories ON nosuch = id") == "Syntax Error: Column 'nosuch' does not exist in 'tasks'."
+
+# 4. GROUP BY with every aggregate, output in SELECT list order
+result = parser.execute(
+    "SELECT COUNT(*), cat_id, SUM(hours), AVG(hours), MIN(name), MAX(name) FROM tasks GROUP BY cat_id ORDER BY cat_id"
+)
+assert result == [
+    {"COUNT(*)": 3, "cat_id": 1, "SUM(hours)": 9, "AVG(hours)": 3.0, "MIN(name)": "Email", "MAX(name)": "Review"},
+    {"COUNT(*)": 1, "cat_id": 2, "SUM(hours)": 2, "AVG(hours)": 2.0, "MIN(name)": "Gym", "MAX(name)": "Gym"},
+]
+assert list(result[0])[:2] == ["COUNT(*)", "cat_id"]
+assert parser.execute("SELECT COUNT(*) FROM tasks WHERE cat_id = 9") == [{"COUNT(*)": 0}]
+assert parser.execute("SELECT SUM(name) FROM tasks") == "Syntax Error: SUM(name) requires a numeric column."
+assert parser.execute("SELECT name, COUNT(*) FROM tasks") == "Syntax Error: Column 'name' must appear in GROUP BY."
+
+# 5. ORDER BY an aggregate
+result = parser.execute("SELECT cat_id, SUM(hours) FROM tasks GROUP BY cat_id ORDER BY SUM(hours) DESC LIMIT 1")
+assert result == [{"cat_id": 1, "SUM(hours)": 9}]
+assert parser.execute("SELECT cat_id FROM tasks GROUP BY cat_id ORDER BY COUNT(*)") == "Syntax Error: Column 'COUNT(*)' does not exist."
+
+# 5b. A LIMIT larger than the sort buffer goes through the spilling sort
+small = Parser(Engine(sort_buffer_rows=2))
+small.execute("CREATE TABLE n (id INT, v INT) PRIMARY KEY id")
+for i in range(10):
+    small.execute(f"INSERT INTO n VALUES ({i}, {(i * 7) % 10})")
+result = small.execute("SELECT id FROM n ORDER BY v DESC LIMIT 5")
+assert result == [{"id": i} for i in (7, 4, 1, 8, 5)]
+assert small.execute("SELECT id FROM n ORDER BY v LIMIT 2") == [{"id": 0}, {"id": 3}]
+
+# 6. Updating an indexed column rebuilds its index
+parser.execute("UPDATE tasks SET id = 100 WHERE id = 1")
+assert isinstance(plan_for("SELECT * FROM tasks WHERE id = 100"), IndexLookup)
+assert parser.execute("SELECT name FROM tasks WHERE id = 100") == [{"name": "Report"}]
+assert parser.execute("SELECT name FROM tasks WHERE id = 1") == []
+
+# 6b. Malformed SELECT lists and GROUP BY clauses are rejected
+assert parser.execute("SELECT id, FROM tasks") == "Syntax Error: Malformed SELECT list."
+assert parser.execute("SELECT FROM tasks") == "Syntax Error: Malformed SELECT list."
+assert parser.execute("SELECT *, COUNT(*) FROM tasks") == "Syntax Error: '*' cannot be combined with other SELECT items."
+assert parser.execute("SELECT cat_id FROM tasks GROUP BY cat_id garbage") == "Syntax Error: Unexpected 'garbage' after GROUP BY clause."
+assert parser.execute("SELECT cat_id FROM tasks GROUP BY cat_id,") == "Syntax Error: Malformed GROUP BY clause."
+assert parser.execute("SELECT cat_id, COUNT(*) FROM tasks GROUP BY cat_id LIMIT 1") == [{"cat_id": 1, "COUNT(*)": 3}]
+
+# 7. Unknown columns are reported, not silently ignored
+assert parser.execute("SELECT nosuch FROM tasks") == "Syntax Error: Column 'nosuch' does not exist."
+assert parser.execute("SELECT * FROM tasks WHERE nosuch = 1") == "Syntax Error: Column 'nosuch' does not exist."
+
+print("Operator pipeline OK")
@@ -0,0 +1,95 @@
+import random
+import tracemalloc
+from engine import Engine, external_sort, top_n
+from parser import Parser
+
+# Tiny sort buffer so the external merge sort has to spill runs to disk
+db = Engine(sort_buffer_rows=100)
+parser = Parser(db)
+
+parser.execute("CREATE TABLE scores (id INT, name STR, score INT) PRIMARY KEY id")
+scores = db.get_table("scores")
+
+random.seed(42)
+for i in range(1, 1001):
+    scores.create_record({"id": i, "name": f"player{i % 7}", "score": random.randint(0, 500)})
+
+# 1. ORDER BY without LIMIT (external merge sort over 10 spilled runs)
+result = parser.execute("SELECT * FROM scores ORDER BY score DESC, id ASC")
+expected = sorted(scores.data, key=lambda r: (-r["score"], r["id"]))
+assert result == expected, "External merge sort returned the wrong order"
+# Spilled runs only hold sort keys, so rows come back as the table's own dicts
+assert all(a is b for a, b in zip(result, expected)), "External sort returned copies"
+print(f"External sort OK ({len(result)} rows)")
+
+# 2. ORDER BY with LIMIT (bounded heap top-N)
+result = parser.execute("SELECT * FROM scores ORDER BY name, score DESC LIMIT 5")
+expected = sorted(scores.data, key=lambda r: (r["name"], -r["score"]))[:5]
+assert result == expected, "Top-N returned the wrong rows"
+for row in result:
+    print(row)
+
+# 3. ORDER BY combined with WHERE
+result = parser.execute("SELECT * FROM scores WHERE name = 'player3' ORDER BY score LIMIT 3")
+assert all(r["name"] == "player3" for r in result)
+assert [r["score"] for r in result] == sorted(r["score"] for r in result)
+print(result)
+
+# 4. Malformed clauses surface as syntax errors
+print(parser.execute("SELECT * FROM scores ORDER score"))
+print(parser.execute("SELECT * FROM scores ORDER BY score LIMIT"))
+assert parser.execute("SELECT * FROM scores ORDER BY nosuch") == "Syntax Error: Column 'nosuch' does not exist."
+assert parser.execute("SELECT * FROM scores ORDER BY score garbage").startswith("Syntax Error: Unexpected 'garbage'")
+assert parser.execute("SELECT * FROM scores ORDER BY score,").startswith("Syntax Error: Malformed ORDER BY")
+assert parser.execute("SELECT * FROM scores ORDER BY id LIMIT 2 garbage").startswith("Syntax Error: Unexpected 'garbage' after LIMIT")
+assert parser.execute("SELECT * FROM scores LIMIT 2 ORDER BY id").startswith("Syntax Error: Unexpected 'ORDER' after LIMIT")
+assert len(parser.execute("SELECT * FROM scores LIMIT 2")) == 2
+
+
+# 5. Spilling keeps the sort's memory footprint fixed
+def sort_peak(rows, buffer_rows):
+    tracemalloc.start()
+    for _ in external_sort(rows, [("score", True), ("id", False)], buffer_rows):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+big = [{"id": i, "score": random.randint(0, 10**6)} for i in range(200_000)]
+in_memory = sort_peak(big, len(big) + 1)
+spilled_half = sort_peak(big[:100_000], 5_000)
+spilled = sort_peak(big, 5_000)
+print(f"Peak memory: in-memory {in_memory / 1e6:.1f} MB, spilled {spilled / 1e6:.1f} MB")
+assert spilled < in_memory / 5, "Spilling should use far less memory than an in-memory sort"
+assert spilled < spilled_half * 1.5, "Spilled sort memory should not grow with the row count"
+
+# 6. NULLs sort last ascending and first descending, on every sort path
+rows = [{"id": 1, "name": "b", "v": 2}, {"id": 2, "name": "a"}, {"id": 3, "name": "a", "v": 1}]
+for buffer_rows in (1, 10):
+    assert [r["id"] for r in external_sort(rows, [("v", False)], buffer_rows)] == [3, 1, 2]
+    assert [r["id"] for r in external_sort(rows, [("v", True)], buffer_rows)] == [2, 1, 3]
+    assert [r["id"] for r in external_sort(rows, [("name", True), ("v", False)], buffer_rows)] == [1, 3, 2]
+assert [r["id"] for r in top_n(rows, [("v", True), ("id", False)], 2)] == [2, 1]
+
+# 7. A tiny buffer makes hundreds of runs; they are merged in passes of at most
+# MERGE_FAN_IN without keeping a file open per run
+try:
+    import resource
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (min(soft, 32), hard))
+except (ImportError, ValueError):
+    resource = None
+
+db = Engine(sort_buffer_rows=10)
+parser = Parser(db)
+parser.execute("CREATE TABLE t (id INT, v INT) PRIMARY KEY id")
+ids = list(range(5000))
+random.shuffle(ids)
+for i in ids:
+    db.get_table("t").create_record({"id": i, "v": i % 3})
+assert [r["id"] for r in parser.execute("SELECT * FROM t ORDER BY id")] == list(range(5000))
+assert parser.execute("SELECT * FROM t ORDER BY v DESC, id") == sorted(db.get_table("t").data, key=lambda r: (-r["v"], r["id"]))
+
+if resource:
+    resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+print("Multi-pass merge OK")